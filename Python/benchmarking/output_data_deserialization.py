@@ -0,0 +1,103 @@
+import cProfile
+import pstats
+import random
+import tracemalloc
+from io import StringIO
+from time import perf_counter
+from tdw.flatbuffers import Builder
+from tdw.FBOutput import AvatarSimpleBody as AvSi
+
+
+"""
+Profile how fast the controller reads AvatarSimpleBody output data.
+
+This doesn't need a build. It creates 10000 random AvatarSimpleBody buffers, then:
+
+1. Times reading each field on its own.
+2. Times reading every field per buffer, via the accessors and via `AvatarSimpleBody.Unpack()`.
+3. Prints the cProfile stats and the tracemalloc peak of the accessor loop.
+
+See: Documentation/benchmark/output_data_deserialization.md
+"""
+
+
+NUM_BUFFERS = 10000
+
+
+def get_buffer() -> bytearray:
+    """
+    :return: A serialized AvatarSimpleBody with random values.
+    """
+
+    b = Builder(0)
+    avatar_id = b.CreateString("a")
+    visible_body = b.CreateString("Cube")
+    r = random.random
+    b.Finish(AvSi.AvatarSimpleBodyPack(b, avatar_id, (r(), r(), r()), (r(), r(), r(), r()), (r(), r(), r()),
+                                       (r(), r(), r()), (r(), r(), r()), r() * 100, r() > 0.5, visible_body))
+    return bytearray(b.Output())
+
+
+def read_all(buffers) -> None:
+    """
+    Read every field of every buffer via the accessors.
+    """
+
+    for buf in buffers:
+        a = AvSi.AvatarSimpleBody.GetRootAsAvatarSimpleBody(buf, 0)
+        a.Id()
+        for v in [a.Position(), a.Forward(), a.Velocity(), a.AngularVelocity()]:
+            v.X(), v.Y(), v.Z()
+        q = a.Rotation()
+        q.X(), q.Y(), q.Z(), q.W()
+        a.Mass()
+        a.Sleeping()
+        a.VisibleBody()
+
+
+def fps(t0: float) -> str:
+    """
+    :return: Buffers read per second since `t0`.
+    """
+
+    return str(round(NUM_BUFFERS / (perf_counter() - t0)))
+
+
+if __name__ == "__main__":
+    bs = [get_buffer() for _ in range(NUM_BUFFERS)]
+    roots = [AvSi.AvatarSimpleBody.GetRootAsAvatarSimpleBody(buf, 0) for buf in bs]
+
+    output = "| Field | Reads per second |\n| --- | --- |\n"
+    for field in ["Id", "Position", "Rotation", "Forward", "Velocity", "AngularVelocity", "Mass", "Sleeping",
+                  "VisibleBody"]:
+        t = perf_counter()
+        for root in roots:
+            getattr(root, field)()
+        output += "| `" + field + "()` | " + fps(t) + " |\n"
+    print(output)
+
+    output = "| Test | Buffers per second |\n| --- | --- |\n"
+    t = perf_counter()
+    read_all(bs)
+    output += "| Accessors | " + fps(t) + " |\n"
+    t = perf_counter()
+    for buf in bs:
+        AvSi.AvatarSimpleBody.Unpack(buf, 0)
+    output += "| `Unpack()` | " + fps(t) + " |\n"
+    print(output)
+
+    # Profile the accessor loop.
+    profiler = cProfile.Profile()
+    profiler.enable()
+    read_all(bs)
+    profiler.disable()
+    s = StringIO()
+    pstats.Stats(profiler, stream=s).sort_stats("tottime").print_stats(15)
+    print(s.getvalue())
+
+    # Measure peak memory of the accessor loop.
+    tracemalloc.start()
+    read_all(bs)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("tracemalloc peak: " + str(peak) + " bytes")
@@ -2,10 +2,15 @@
 
 # namespace: FBOutput
 
+import numpy as np
 import tdw.flatbuffers
+from tdw.flatbuffers.table import Table
+from .Color import Color
+
+_MISSING = object()
 
 class AvatarSegmentationColor(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_tab', '_off', '_cache']
 
     @classmethod
     def GetRootAsAvatarSegmentationColor(cls, buf, offset):
@@ -16,27 +21,54 @@ class AvatarSegmentationColor(object):
 
     # AvatarSegmentationColor
     def Init(self, buf, pos):
-        self._tab = tdw.flatbuffers.table.Table(buf, pos)
+        self._tab = Table(buf, pos)
+        self._off = None
+        # Field values that have already been read. Tables are read-only, so these never go stale.
+        self._cache = {}
+
+    # AvatarSegmentationColor
+    # The vtable is read once, on the first field access.
+    def _vtable(self):
+        if self._off is None:
+            self._off = self._tab.Offsets(2)
+        return self._off
 
     # AvatarSegmentationColor
     def Id(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        v = self._cache.get('Id', _MISSING)
+        if v is _MISSING:
+            o = self._vtable()[0]
+            v = self._tab.String(o + self._tab.Pos) if o != 0 else None
+            self._cache['Id'] = v
+        return v
+
+    # AvatarSegmentationColor
+    # A memoryview of the raw string bytes. Compare it to a bytes literal without copying or decoding.
+    def IdAsBytes(self):
+        o = self._vtable()[0]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return self._tab.StringAsBytes(o + self._tab.Pos)
         return None
 
     # AvatarSegmentationColor
     def SegmentationColor(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._vtable()[1]
         if o != 0:
             x = o + self._tab.Pos
-            from .Color import Color
             obj = Color()
             obj.Init(self._tab.Bytes, x)
             return obj
         return None
 
+    # AvatarSegmentationColor
+    # A numpy array that views the struct in place, without a wrapper object.
+    def SegmentationColorAsArray(self):
+        o = self._vtable()[1]
+        if o != 0:
+            return np.frombuffer(self._tab.Bytes, dtype='<i4', count=3, offset=o + self._tab.Pos)
+        return None
+
 def AvatarSegmentationColorStart(builder): builder.StartObject(2)
-def AvatarSegmentationColorAddId(builder, id): builder.PrependUOffsetTRelativeSlot(0, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(id), 0)
-def AvatarSegmentationColorAddSegmentationColor(builder, segmentationColor): builder.PrependStructSlot(1, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(segmentationColor), 0)
+def AvatarSegmentationColorAddId(builder, id): builder.PrependUOffsetTRelativeSlot(0, id, 0)
+def AvatarSegmentationColorAddSegmentationColor(builder, segmentationColor): builder.PrependStructSlot(1, segmentationColor, 0)
 def AvatarSegmentationColorEnd(builder): return builder.EndObject()
@@ -2,10 +2,43 @@
 
 # namespace: FBOutput
 
+import numpy as np
 import tdw.flatbuffers
+from tdw.flatbuffers.table import Table
+from .Vector3 import Vector3, CreateVector3
+from .Quaternion import Quaternion, CreateQuaternion
+from tdw.flatbuffers.descriptors import StringProperty, StructProperty, Float32Property, BoolProperty
+from tdw.flatbuffers.reader import compile_reader, STRING, STRUCT, SCALAR
+from tdw.flatbuffers.pool import acquire
+
+_MISSING = object()
 
 class AvatarSimpleBody(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_tab', '_off', '_cache']
+
+    # Attribute access to each field, e.g. body.mass instead of body.Mass().
+    id = StringProperty(4)
+    position = StructProperty(6, Vector3)
+    rotation = StructProperty(8, Quaternion)
+    forward = StructProperty(10, Vector3)
+    velocity = StructProperty(12, Vector3)
+    angularVelocity = StructProperty(14, Vector3)
+    mass = Float32Property(16)
+    sleeping = BoolProperty(18)
+    visibleBody = StringProperty(20)
+
+    # Read every field of the table rooted at buf[offset] in one call. Returns a tuple:
+    # (id, position, rotation, forward, velocity, angularVelocity, mass, sleeping, visibleBody)
+    # where the struct fields are (x, y, z) or (x, y, z, w) tuples.
+    Unpack = staticmethod(compile_reader("AvatarSimpleBody", [(STRING, None, None),
+                                                              (STRUCT, "3f", None),
+                                                              (STRUCT, "4f", None),
+                                                              (STRUCT, "3f", None),
+                                                              (STRUCT, "3f", None),
+                                                              (STRUCT, "3f", None),
+                                                              (SCALAR, "f", 0.0),
+                                                              (SCALAR, "?", False),
+                                                              (STRING, None, None)]))
 
     @classmethod
     def GetRootAsAvatarSimpleBody(cls, buf, offset):
@@ -16,99 +49,187 @@ class AvatarSimpleBody(object):
 
     # AvatarSimpleBody
     def Init(self, buf, pos):
-        self._tab = tdw.flatbuffers.table.Table(buf, pos)
+        self._tab = Table(buf, pos)
+        self._off = None
+        # Field values that have already been read. Tables are read-only, so these never go stale.
+        self._cache = {}
+
+    # AvatarSimpleBody
+    # The vtable is read once, on the first field access.
+    def _vtable(self):
+        if self._off is None:
+            self._off = self._tab.Offsets(9)
+        return self._off
 
     # AvatarSimpleBody
     def Id(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        v = self._cache.get('Id', _MISSING)
+        if v is _MISSING:
+            o = self._vtable()[0]
+            v = self._tab.String(o + self._tab.Pos) if o != 0 else None
+            self._cache['Id'] = v
+        return v
+
+    # AvatarSimpleBody
+    # A memoryview of the raw string bytes. Compare it to a bytes literal without copying or decoding.
+    def IdAsBytes(self):
+        o = self._vtable()[0]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return self._tab.StringAsBytes(o + self._tab.Pos)
         return None
 
     # AvatarSimpleBody
     def Position(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._vtable()[1]
         if o != 0:
             x = o + self._tab.Pos
-            from .Vector3 import Vector3
-            obj = Vector3()
-            obj.Init(self._tab.Bytes, x)
-            return obj
+            return acquire(Vector3, self._tab.Bytes, x)
+        return None
+
+    # AvatarSimpleBody
+    # A numpy array that views the struct in place, without a wrapper object.
+    def PositionAsArray(self):
+        o = self._vtable()[1]
+        if o != 0:
+            return np.frombuffer(self._tab.Bytes, dtype='<f4', count=3, offset=o + self._tab.Pos)
         return None
 
     # AvatarSimpleBody
     def Rotation(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._vtable()[2]
         if o != 0:
             x = o + self._tab.Pos
-            from .Quaternion import Quaternion
-            obj = Quaternion()
-            obj.Init(self._tab.Bytes, x)
-            return obj
+            return acquire(Quaternion, self._tab.Bytes, x)
+        return None
+
+    # AvatarSimpleBody
+    # A numpy array that views the struct in place, without a wrapper object.
+    def RotationAsArray(self):
+        o = self._vtable()[2]
+        if o != 0:
+            return np.frombuffer(self._tab.Bytes, dtype='<f4', count=4, offset=o + self._tab.Pos)
         return None
 
     # AvatarSimpleBody
     def Forward(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._vtable()[3]
         if o != 0:
             x = o + self._tab.Pos
-            from .Vector3 import Vector3
-            obj = Vector3()
-            obj.Init(self._tab.Bytes, x)
-            return obj
+            return acquire(Vector3, self._tab.Bytes, x)
+        return None
+
+    # AvatarSimpleBody
+    # A numpy array that views the struct in place, without a wrapper object.
+    def ForwardAsArray(self):
+        o = self._vtable()[3]
+        if o != 0:
+            return np.frombuffer(self._tab.Bytes, dtype='<f4', count=3, offset=o + self._tab.Pos)
         return None
 
     # AvatarSimpleBody
     def Velocity(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._vtable()[4]
         if o != 0:
             x = o + self._tab.Pos
-            from .Vector3 import Vector3
-            obj = Vector3()
-            obj.Init(self._tab.Bytes, x)
-            return obj
+            return acquire(Vector3, self._tab.Bytes, x)
+        return None
+
+    # AvatarSimpleBody
+    # A numpy array that views the struct in place, without a wrapper object.
+    def VelocityAsArray(self):
+        o = self._vtable()[4]
+        if o != 0:
+            return np.frombuffer(self._tab.Bytes, dtype='<f4', count=3, offset=o + self._tab.Pos)
         return None
 
     # AvatarSimpleBody
     def AngularVelocity(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(14))
+        o = self._vtable()[5]
         if o != 0:
             x = o + self._tab.Pos
-            from .Vector3 import Vector3
-            obj = Vector3()
-            obj.Init(self._tab.Bytes, x)
-            return obj
+            return acquire(Vector3, self._tab.Bytes, x)
+        return None
+
+    # AvatarSimpleBody
+    # A numpy array that views the struct in place, without a wrapper object.
+    def AngularVelocityAsArray(self):
+        o = self._vtable()[5]
+        if o != 0:
+            return np.frombuffer(self._tab.Bytes, dtype='<f4', count=3, offset=o + self._tab.Pos)
         return None
 
     # AvatarSimpleBody
     def Mass(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(16))
+        o = self._vtable()[6]
         if o != 0:
-            return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
+            return self._tab.GetFloat32(o + self._tab.Pos)
         return 0.0
 
     # AvatarSimpleBody
     def Sleeping(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(18))
+        o = self._vtable()[7]
         if o != 0:
-            return bool(self._tab.Get(tdw.flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
+            return self._tab.GetBool(o + self._tab.Pos)
         return False
 
     # AvatarSimpleBody
     def VisibleBody(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(20))
+        v = self._cache.get('VisibleBody', _MISSING)
+        if v is _MISSING:
+            o = self._vtable()[8]
+            v = self._tab.String(o + self._tab.Pos) if o != 0 else None
+            self._cache['VisibleBody'] = v
+        return v
+
+    # AvatarSimpleBody
+    # A memoryview of the raw string bytes. Compare it to a bytes literal without copying or decoding.
+    def VisibleBodyAsBytes(self):
+        o = self._vtable()[8]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return self._tab.StringAsBytes(o + self._tab.Pos)
         return None
 
 def AvatarSimpleBodyStart(builder): builder.StartObject(9)
-def AvatarSimpleBodyAddId(builder, id): builder.PrependUOffsetTRelativeSlot(0, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(id), 0)
-def AvatarSimpleBodyAddPosition(builder, position): builder.PrependStructSlot(1, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(position), 0)
-def AvatarSimpleBodyAddRotation(builder, rotation): builder.PrependStructSlot(2, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(rotation), 0)
-def AvatarSimpleBodyAddForward(builder, forward): builder.PrependStructSlot(3, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(forward), 0)
-def AvatarSimpleBodyAddVelocity(builder, velocity): builder.PrependStructSlot(4, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(velocity), 0)
-def AvatarSimpleBodyAddAngularVelocity(builder, angularVelocity): builder.PrependStructSlot(5, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(angularVelocity), 0)
+def AvatarSimpleBodyAddId(builder, id): builder.PrependUOffsetTRelativeSlot(0, id, 0)
+def AvatarSimpleBodyAddPosition(builder, position): builder.PrependStructSlot(1, position, 0)
+def AvatarSimpleBodyAddRotation(builder, rotation): builder.PrependStructSlot(2, rotation, 0)
+def AvatarSimpleBodyAddForward(builder, forward): builder.PrependStructSlot(3, forward, 0)
+def AvatarSimpleBodyAddVelocity(builder, velocity): builder.PrependStructSlot(4, velocity, 0)
+def AvatarSimpleBodyAddAngularVelocity(builder, angularVelocity): builder.PrependStructSlot(5, angularVelocity, 0)
 def AvatarSimpleBodyAddMass(builder, mass): builder.PrependFloat32Slot(6, mass, 0.0)
 def AvatarSimpleBodyAddSleeping(builder, sleeping): builder.PrependBoolSlot(7, sleeping, 0)
-def AvatarSimpleBodyAddVisibleBody(builder, visibleBody): builder.PrependUOffsetTRelativeSlot(8, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(visibleBody), 0)
+def AvatarSimpleBodyAddVisibleBody(builder, visibleBody): builder.PrependUOffsetTRelativeSlot(8, visibleBody, 0)
 def AvatarSimpleBodyEnd(builder): return builder.EndObject()
+
+# Build a whole AvatarSimpleBody in one call. `id` and `visibleBody` are string offsets (0 to omit).
+# The struct fields are (x, y, z) or, for `rotation`, (x, y, z, w) tuples (None to omit).
+def AvatarSimpleBodyPack(builder, id, position, rotation, forward, velocity, angularVelocity, mass, sleeping, visibleBody):
+    builder.StartObject(9)
+    if visibleBody != 0:
+        builder.PrependUOffsetTRelative(visibleBody)
+        builder.Slot(8)
+    if mass != 0.0:
+        builder.PrependFloat32(mass)
+        builder.Slot(6)
+    if angularVelocity is not None:
+        CreateVector3(builder, *angularVelocity)
+        builder.Slot(5)
+    if velocity is not None:
+        CreateVector3(builder, *velocity)
+        builder.Slot(4)
+    if forward is not None:
+        CreateVector3(builder, *forward)
+        builder.Slot(3)
+    if rotation is not None:
+        CreateQuaternion(builder, *rotation)
+        builder.Slot(2)
+    if position is not None:
+        CreateVector3(builder, *position)
+        builder.Slot(1)
+    if id != 0:
+        builder.PrependUOffsetTRelative(id)
+        builder.Slot(0)
+    if sleeping:
+        builder.PrependBool(sleeping)
+        builder.Slot(7)
+    return builder.EndObject()
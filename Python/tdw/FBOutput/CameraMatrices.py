@@ -2,10 +2,18 @@
 
 # namespace: FBOutput
 
+import struct
+import numpy as np
 import tdw.flatbuffers
+from tdw.flatbuffers.table import Table
+
+_FLOAT32 = tdw.flatbuffers.number_types.Float32Flags
+_CAMERA_MATRICES_DTYPE = np.dtype([('avatar_id', object), ('sensor_name', object),
+                                   ('projection_matrix', '<f4', (4, 4)), ('camera_matrix', '<f4', (4, 4))])
+_MISSING = object()
 
 class CameraMatrices(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_tab', '_off', '_cache']
 
     @classmethod
     def GetRootAsCameraMatrices(cls, buf, offset):
@@ -16,71 +24,167 @@ class CameraMatrices(object):
 
     # CameraMatrices
     def Init(self, buf, pos):
-        self._tab = tdw.flatbuffers.table.Table(buf, pos)
+        self._tab = Table(buf, pos)
+        self._off = None
+        # Field values that have already been read. Tables are read-only, so these never go stale.
+        self._cache = {}
+
+    # CameraMatrices
+    # The vtable is read once, on the first field access.
+    def _vtable(self):
+        if self._off is None:
+            self._off = self._tab.Offsets(4)
+        return self._off
 
     # CameraMatrices
     def AvatarId(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        v = self._cache.get('AvatarId', _MISSING)
+        if v is _MISSING:
+            o = self._vtable()[0]
+            v = self._tab.String(o + self._tab.Pos) if o != 0 else None
+            self._cache['AvatarId'] = v
+        return v
+
+    # CameraMatrices
+    # A memoryview of the raw string bytes. Compare it to a bytes literal without copying or decoding.
+    def AvatarIdAsBytes(self):
+        o = self._vtable()[0]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return self._tab.StringAsBytes(o + self._tab.Pos)
         return None
 
     # CameraMatrices
     def SensorName(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        v = self._cache.get('SensorName', _MISSING)
+        if v is _MISSING:
+            o = self._vtable()[1]
+            v = self._tab.String(o + self._tab.Pos) if o != 0 else None
+            self._cache['SensorName'] = v
+        return v
+
+    # CameraMatrices
+    # A memoryview of the raw string bytes. Compare it to a bytes literal without copying or decoding.
+    def SensorNameAsBytes(self):
+        o = self._vtable()[1]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return self._tab.StringAsBytes(o + self._tab.Pos)
         return None
 
     # CameraMatrices
     def ProjectionMatrix(self, j):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._vtable()[2]
         if o != 0:
             a = self._tab.Vector(o)
-            return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, a + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            return self._tab.GetFloat32(a + j * 4)
         return 0
 
+    # CameraMatrices
+    # All elements as a tuple of floats, read with one unpack. Use this instead of ProjectionMatrix(j) in a loop.
+    def ProjectionMatrixItems(self):
+        o = self._vtable()[2]
+        if o != 0:
+            return struct.unpack_from("<%df" % self._tab.VectorLen(o), self._tab.Bytes, self._tab.Vector(o))
+        return ()
+
     # CameraMatrices
     def ProjectionMatrixAsNumpy(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._vtable()[2]
+        if o != 0:
+            return self._tab.GetVectorAsNumpy(_FLOAT32, o)
+        return 0
+
+    # CameraMatrices
+    # A (4, 4) view of the matrix. Like ProjectionMatrixAsNumpy(), this aliases the underlying buffer, which must outlive it.
+    # Prefer this over calling ProjectionMatrix(j) in a loop.
+    # The view is C-contiguous float32, so torch.from_numpy() can wrap it without a copy.
+    def ProjectionMatrixAsMatrix(self):
+        o = self._vtable()[2]
+        if o != 0:
+            return self._tab.GetVectorAsNumpy(_FLOAT32, o).reshape(4, 4)
+        return 0
+
+    # CameraMatrices
+    # The raw little-endian float32 bytes of the matrix as a memoryview into the underlying buffer.
+    def ProjectionMatrixAsBytes(self):
+        o = self._vtable()[2]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(tdw.flatbuffers.number_types.Float32Flags, o)
+            a = self._tab.Vector(o)
+            return memoryview(self._tab.Bytes)[a:a + self._tab.VectorLen(o) * 4]
         return 0
 
     # CameraMatrices
     def ProjectionMatrixLength(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._vtable()[2]
         if o != 0:
             return self._tab.VectorLen(o)
         return 0
 
     # CameraMatrices
     def CameraMatrix(self, j):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._vtable()[3]
         if o != 0:
             a = self._tab.Vector(o)
-            return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, a + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            return self._tab.GetFloat32(a + j * 4)
         return 0
 
+    # CameraMatrices
+    # All elements as a tuple of floats, read with one unpack. Use this instead of CameraMatrix(j) in a loop.
+    def CameraMatrixItems(self):
+        o = self._vtable()[3]
+        if o != 0:
+            return struct.unpack_from("<%df" % self._tab.VectorLen(o), self._tab.Bytes, self._tab.Vector(o))
+        return ()
+
     # CameraMatrices
     def CameraMatrixAsNumpy(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._vtable()[3]
+        if o != 0:
+            return self._tab.GetVectorAsNumpy(_FLOAT32, o)
+        return 0
+
+    # CameraMatrices
+    # A (4, 4) view of the matrix. Like CameraMatrixAsNumpy(), this aliases the underlying buffer, which must outlive it.
+    # Prefer this over calling CameraMatrix(j) in a loop.
+    # The view is C-contiguous float32, so torch.from_numpy() can wrap it without a copy.
+    def CameraMatrixAsMatrix(self):
+        o = self._vtable()[3]
+        if o != 0:
+            return self._tab.GetVectorAsNumpy(_FLOAT32, o).reshape(4, 4)
+        return 0
+
+    # CameraMatrices
+    # The raw little-endian float32 bytes of the matrix as a memoryview into the underlying buffer.
+    def CameraMatrixAsBytes(self):
+        o = self._vtable()[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(tdw.flatbuffers.number_types.Float32Flags, o)
+            a = self._tab.Vector(o)
+            return memoryview(self._tab.Bytes)[a:a + self._tab.VectorLen(o) * 4]
         return 0
 
     # CameraMatrices
     def CameraMatrixLength(self):
-        o = tdw.flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._vtable()[3]
         if o != 0:
             return self._tab.VectorLen(o)
         return 0
 
+# Decode the CameraMatrices tables rooted at each of `offsets` in `buf` into one structured array.
+# result['projection_matrix'] and result['camera_matrix'] are (N, 4, 4) float32 arrays.
+# Pass them whole to numpy's batched linear algebra (e.g. np.linalg.inv(result['camera_matrix'])),
+# which makes one BLAS/LAPACK call for the whole stack instead of one per matrix.
+def GetRootAsCameraMatricesMany(buf, offsets):
+    result = np.zeros(len(offsets), dtype=_CAMERA_MATRICES_DTYPE)
+    x = CameraMatrices()
+    for i, offset in enumerate(offsets):
+        x.Init(buf, offset + tdw.flatbuffers.encode.Get(tdw.flatbuffers.packer.uoffset, buf, offset))
+        result[i] = (x.AvatarId(), x.SensorName(), x.ProjectionMatrixAsMatrix(), x.CameraMatrixAsMatrix())
+    return result
+
 def CameraMatricesStart(builder): builder.StartObject(4)
-def CameraMatricesAddAvatarId(builder, avatarId): builder.PrependUOffsetTRelativeSlot(0, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(avatarId), 0)
-def CameraMatricesAddSensorName(builder, sensorName): builder.PrependUOffsetTRelativeSlot(1, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(sensorName), 0)
-def CameraMatricesAddProjectionMatrix(builder, projectionMatrix): builder.PrependUOffsetTRelativeSlot(2, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(projectionMatrix), 0)
+def CameraMatricesAddAvatarId(builder, avatarId): builder.PrependUOffsetTRelativeSlot(0, avatarId, 0)
+def CameraMatricesAddSensorName(builder, sensorName): builder.PrependUOffsetTRelativeSlot(1, sensorName, 0)
+def CameraMatricesAddProjectionMatrix(builder, projectionMatrix): builder.PrependUOffsetTRelativeSlot(2, projectionMatrix, 0)
 def CameraMatricesStartProjectionMatrixVector(builder, numElems): return builder.StartVector(4, numElems, 4)
-def CameraMatricesAddCameraMatrix(builder, cameraMatrix): builder.PrependUOffsetTRelativeSlot(3, tdw.flatbuffers.number_types.UOffsetTFlags.py_type(cameraMatrix), 0)
+def CameraMatricesAddCameraMatrix(builder, cameraMatrix): builder.PrependUOffsetTRelativeSlot(3, cameraMatrix, 0)
 def CameraMatricesStartCameraMatrixVector(builder, numElems): return builder.StartVector(4, numElems, 4)
 def CameraMatricesEnd(builder): return builder.EndObject()
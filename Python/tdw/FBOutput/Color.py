@@ -3,20 +3,21 @@
 # namespace: FBOutput
 
 import tdw.flatbuffers
+from tdw.flatbuffers.table import Table
 
 class Color(object):
     __slots__ = ['_tab']
 
     # Color
     def Init(self, buf, pos):
-        self._tab = tdw.flatbuffers.table.Table(buf, pos)
+        self._tab = Table(buf, pos)
 
     # Color
-    def R(self): return self._tab.Get(tdw.flatbuffers.number_types.Int32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(0))
+    def R(self): return self._tab.GetInt32(self._tab.Pos + 0)
     # Color
-    def G(self): return self._tab.Get(tdw.flatbuffers.number_types.Int32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(4))
+    def G(self): return self._tab.GetInt32(self._tab.Pos + 4)
     # Color
-    def B(self): return self._tab.Get(tdw.flatbuffers.number_types.Int32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(8))
+    def B(self): return self._tab.GetInt32(self._tab.Pos + 8)
 
 def CreateColor(builder, r, g, b):
     builder.Prep(4, 12)
@@ -3,22 +3,23 @@
 # namespace: FBOutput
 
 import tdw.flatbuffers
+from tdw.flatbuffers.table import Table
 
 class Quaternion(object):
     __slots__ = ['_tab']
 
     # Quaternion
     def Init(self, buf, pos):
-        self._tab = tdw.flatbuffers.table.Table(buf, pos)
+        self._tab = Table(buf, pos)
 
     # Quaternion
-    def X(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(0))
+    def X(self): return self._tab.GetFloat32(self._tab.Pos + 0)
     # Quaternion
-    def Y(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(4))
+    def Y(self): return self._tab.GetFloat32(self._tab.Pos + 4)
     # Quaternion
-    def Z(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(8))
+    def Z(self): return self._tab.GetFloat32(self._tab.Pos + 8)
     # Quaternion
-    def W(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(12))
+    def W(self): return self._tab.GetFloat32(self._tab.Pos + 12)
 
 def CreateQuaternion(builder, x, y, z, w):
     builder.Prep(4, 16)
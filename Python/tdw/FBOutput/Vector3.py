@@ -3,20 +3,21 @@
 # namespace: FBOutput
 
 import tdw.flatbuffers
+from tdw.flatbuffers.table import Table
 
 class Vector3(object):
     __slots__ = ['_tab']
 
     # Vector3
     def Init(self, buf, pos):
-        self._tab = tdw.flatbuffers.table.Table(buf, pos)
+        self._tab = Table(buf, pos)
 
     # Vector3
-    def X(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(0))
+    def X(self): return self._tab.GetFloat32(self._tab.Pos + 0)
     # Vector3
-    def Y(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(4))
+    def Y(self): return self._tab.GetFloat32(self._tab.Pos + 4)
     # Vector3
-    def Z(self): return self._tab.Get(tdw.flatbuffers.number_types.Float32Flags, self._tab.Pos + tdw.flatbuffers.number_types.UOffsetTFlags.py_type(8))
+    def Z(self): return self._tab.GetFloat32(self._tab.Pos + 8)
 
 def CreateVector3(builder, x, y, z):
     builder.Prep(4, 12)
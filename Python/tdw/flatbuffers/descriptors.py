@@ -0,0 +1,91 @@
+"""Non-data descriptors that read a table field on attribute access.
+
+A table class declares its fields once, e.g. `mass = Float32Property(16, 0.0)`,
+instead of generating one accessor method per field. Each descriptor holds the
+field's vtable offset and default, and reads through the instance's `_tab`.
+If the table class caches its vtable in a `_vtable()` method, the descriptor
+reads the field's offset from that cache instead of walking the vtable."""
+
+from . import number_types as N
+
+
+class Property(object):
+    """A scalar field of the type specified by `flags`. Resolves the field's
+       offset and falls back to `default` if the field isn't present in the
+       table. Non-scalar fields override `read`."""
+
+    __slots__ = ("vtableOffset", "flags", "default", "slot", "cached")
+
+    def __init__(self, vtableOffset, flags, default=0):
+        self.vtableOffset = vtableOffset
+        self.flags = flags
+        self.default = default
+        # The index of the field in the table's cached vtable.
+        self.slot = (vtableOffset - 4) // 2
+        self.cached = False
+
+    def __set_name__(self, owner, name):
+        self.cached = hasattr(owner, "_vtable")
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+        tab = inst._tab
+        if self.cached:
+            o = inst._vtable()[self.slot]
+        else:
+            o = tab.Offset(self.vtableOffset)
+        if o != 0:
+            return self.read(tab, o + tab.Pos)
+        return self.default
+
+    def read(self, tab, pos):
+        return tab.Get(self.flags, pos)
+
+
+class Float32Property(Property):
+    __slots__ = ()
+
+    def __init__(self, vtableOffset, default=0.0):
+        super(Float32Property, self).__init__(vtableOffset, N.Float32Flags, default)
+
+    def read(self, tab, pos):
+        return tab.GetFloat32(pos)
+
+
+class BoolProperty(Property):
+    __slots__ = ()
+
+    def __init__(self, vtableOffset, default=False):
+        super(BoolProperty, self).__init__(vtableOffset, N.BoolFlags, default)
+
+    def read(self, tab, pos):
+        return tab.GetBool(pos)
+
+
+class StringProperty(Property):
+    """A string field, returned as bytes."""
+
+    __slots__ = ()
+
+    def __init__(self, vtableOffset):
+        super(StringProperty, self).__init__(vtableOffset, N.UOffsetTFlags, None)
+
+    def read(self, tab, pos):
+        return tab.String(pos)
+
+
+class StructProperty(Property):
+    """An inline struct field, returned as an instance of `struct_type`."""
+
+    __slots__ = ("struct_type",)
+
+    def __init__(self, vtableOffset, struct_type):
+        # Structs are stored inline, so there are no flags to read them with.
+        super(StructProperty, self).__init__(vtableOffset, None, None)
+        self.struct_type = struct_type
+
+    def read(self, tab, pos):
+        obj = self.struct_type()
+        obj.Init(tab.Bytes, pos)
+        return obj
@@ -0,0 +1,65 @@
+"""Reuse struct wrapper objects (e.g. `Vector3`) instead of allocating a new
+object and Table for every field that is read.
+
+Pooling is opt-in and per thread. Outside of a `pooled()` block, `acquire()`
+always returns a new object and `release()` does nothing:
+
+    with pooled():
+        for resp in responses:
+            ...  # e.g. AvatarSimpleBody.Position() reuses released objects.
+
+An object passed to `release()` must not be used afterwards."""
+
+import threading
+from contextlib import contextmanager
+
+# The maximum number of released objects kept for reuse, per type and thread.
+POOL_SIZE = 64
+
+# `_local.pools` is this thread's pools (Key = type. Value = released objects), or None if pooling is disabled.
+_local = threading.local()
+
+
+@contextmanager
+def pooled():
+    """Enable pooling on this thread until the end of the block."""
+
+    pools = getattr(_local, "pools", None)
+    if pools is None:
+        _local.pools = {}
+    try:
+        yield
+    finally:
+        # Nested blocks leave pooling enabled until the outermost block ends.
+        if pools is None:
+            _local.pools = None
+
+
+def acquire(cls, buf, pos):
+    """Returns an instance of the struct type `cls` that reads `buf` at `pos`."""
+
+    pools = getattr(_local, "pools", None)
+    if pools:
+        pool = pools.get(cls)
+        if pool:
+            obj = pool.pop()
+            obj._tab.Bytes = buf
+            obj._tab.Pos = pos
+            return obj
+    obj = cls()
+    obj.Init(buf, pos)
+    return obj
+
+
+def release(obj):
+    """Return `obj` to this thread's pool, if pooling is enabled."""
+
+    pools = getattr(_local, "pools", None)
+    # Ignore objects that were already released.
+    if pools is None or obj is None or obj._tab.Bytes is None:
+        return
+    # Don't keep the message's buffer alive while pooled.
+    obj._tab.Bytes = None
+    pool = pools.setdefault(type(obj), [])
+    if len(pool) < POOL_SIZE:
+        pool.append(obj)
@@ -0,0 +1,69 @@
+"""Compile a straight-line reader for a table with a fixed schema.
+
+`compile_reader()` generates and `exec`s the source of one function that
+decodes every field of a table at once. All vtable slots, struct formats and
+defaults are inlined as constants, so reading a whole table costs one Python
+call instead of one accessor call (plus vtable lookup) per field."""
+
+import struct
+
+from . import packer
+from .table import Table
+
+STRING = "string"
+STRUCT = "struct"
+SCALAR = "scalar"
+
+
+def compile_reader(name, fields):
+    """
+    Returns a function `read(buf, offset)` that reads the table whose root
+    offset is stored at `buf[offset]` and returns a tuple with one value per
+    field, in order.
+
+    `fields` lists each field in vtable order as `(kind, fmt, default)`:
+
+    - `(STRING, None, None)` reads bytes.
+    - `(STRUCT, fmt, None)` reads an inline struct as a tuple, e.g. `"3f"`.
+    - `(SCALAR, fmt, default)` reads one value, e.g. `"f"` or `"?"`.
+
+    A field that is missing from the table reads as its default.
+    """
+
+    n = len(fields)
+    names = ["o%d" % i for i in range(n)]
+    ns = {"_uoffset": packer.uoffset.unpack_from,
+          "_soffset": packer.soffset.unpack_from,
+          "_voffset": packer.voffset.unpack_from,
+          "_vtable": struct.Struct("<%dH" % n).unpack_from,
+          "_Table": Table}
+    lines = ["def read_%s(buf, offset):" % name,
+             "    pos = offset + _uoffset(buf, offset)[0]",
+             "    vtable = pos - _soffset(buf, pos)[0]",
+             "    if _voffset(buf, vtable)[0] >= %d:" % (4 + 2 * n),
+             "        %s, = _vtable(buf, vtable + 4)" % ", ".join(names),
+             "    else:",
+             "        %s, = _Table(buf, pos).Offsets(%d)" % (", ".join(names), n)]
+    values = []
+    for i, (kind, fmt, default) in enumerate(fields):
+        o = names[i]
+        v = "f%d" % i
+        if kind == STRING:
+            lines += ["    if %s != 0:" % o,
+                      "        p = pos + %s" % o,
+                      "        p += _uoffset(buf, p)[0]",
+                      "        %s = bytes(memoryview(buf)[p + 4:p + 4 + _uoffset(buf, p)[0]])" % v,
+                      "    else:",
+                      "        %s = None" % v]
+        elif kind == STRUCT:
+            ns["_s%d" % i] = struct.Struct("<" + fmt).unpack_from
+            lines.append("    %s = _s%d(buf, pos + %s) if %s != 0 else None" % (v, i, o, o))
+        elif kind == SCALAR:
+            ns["_s%d" % i] = struct.Struct("<" + fmt).unpack_from
+            lines.append("    %s = _s%d(buf, pos + %s)[0] if %s != 0 else %r" % (v, i, o, o, default))
+        else:
+            raise ValueError("Unknown field kind: %s" % kind)
+        values.append(v)
+    lines.append("    return (%s,)" % ", ".join(values))
+    exec(compile("\n".join(lines) + "\n", "<flatbuffers reader %s>" % name, "exec"), ns)
+    return ns["read_%s" % name]
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import struct
+
 from . import encode
+from . import packer
 from . import number_types as N
 
+_UOFFSET_MAX = N.UOffsetTFlags.max_val
+
 
 class Table(object):
     """Table wraps a byte slice and provides read access to its data.
@@ -24,7 +29,10 @@ class Table(object):
     __slots__ = ("Bytes", "Pos")
 
     def __init__(self, buf, pos):
-        N.enforce_number(pos, N.UOffsetTFlags)
+        # A Table is created for every table and struct that is read, so
+        # this is N.enforce_number(pos, N.UOffsetTFlags) without the call.
+        if not 0 <= pos <= _UOFFSET_MAX:
+            raise TypeError("bad number %s for type %s" % (str(pos), N.UOffsetTFlags.name))
 
         self.Bytes = buf
         self.Pos = pos
@@ -32,14 +40,31 @@ class Table(object):
     def Offset(self, vtableOffset):
         """Offset provides access into the Table's vtable.
 
-        Deprecated fields are ignored by checking the vtable's length."""
+        Deprecated fields are ignored by checking the vtable's length.
+
+        This is called once per field read, so it unpacks directly with the
+        pre-compiled packers instead of dispatching through `Get`."""
 
-        vtable = self.Pos - self.Get(N.SOffsetTFlags, self.Pos)
-        vtableEnd = self.Get(N.VOffsetTFlags, vtable)
+        buf = self.Bytes
+        vtable = self.Pos - packer.soffset.unpack_from(buf, self.Pos)[0]
+        vtableEnd = packer.voffset.unpack_from(buf, vtable)[0]
         if vtableOffset < vtableEnd:
-            return self.Get(N.VOffsetTFlags, vtable + vtableOffset)
+            return packer.voffset.unpack_from(buf, vtable + vtableOffset)[0]
         return 0
 
+    def Offsets(self, numFields):
+        """Offsets reads the vtable entries of the first `numFields` fields
+           in one pass. Fields that are missing from the vtable are 0."""
+
+        buf = self.Bytes
+        vtable = self.Pos - packer.soffset.unpack_from(buf, self.Pos)[0]
+        vtableEnd = packer.voffset.unpack_from(buf, vtable)[0]
+        n = min(numFields, max(0, (vtableEnd - 4) // 2))
+        offsets = struct.unpack_from("<%dH" % n, buf, vtable + 4)
+        if n < numFields:
+            offsets += (0,) * (numFields - n)
+        return offsets
+
     def Indirect(self, off):
         """Indirect retrieves the relative offset stored at `offset`."""
         N.enforce_number(off, N.UOffsetTFlags)
@@ -47,11 +72,16 @@ class Table(object):
 
     def String(self, off):
         """String gets a string from data stored inside the flatbuffer."""
+        return bytes(self.StringAsBytes(off))
+
+    def StringAsBytes(self, off):
+        """StringAsBytes returns the raw bytes of a string stored inside the
+           flatbuffer as a memoryview into Bytes, without copying them."""
         N.enforce_number(off, N.UOffsetTFlags)
         off += encode.Get(N.UOffsetTFlags.packer_type, self.Bytes, off)
         start = off + N.UOffsetTFlags.bytewidth
         length = encode.Get(N.UOffsetTFlags.packer_type, self.Bytes, off)
-        return bytes(self.Bytes[start:start+length])
+        return memoryview(self.Bytes)[start:start+length]
 
     def VectorLen(self, off):
         """VectorLen retrieves the length of the vector whose offset is stored
@@ -92,6 +122,19 @@ class Table(object):
         N.enforce_number(off, N.UOffsetTFlags)
         return flags.py_type(encode.Get(flags.packer_type, self.Bytes, off))
 
+    # Specialized versions of Get() for the hot accessors. These skip the
+    # `flags` dispatch and the bounds check and unpack with the
+    # pre-compiled packer directly.
+
+    def GetFloat32(self, off):
+        return packer.float32.unpack_from(self.Bytes, off)[0]
+
+    def GetInt32(self, off):
+        return packer.int32.unpack_from(self.Bytes, off)[0]
+
+    def GetBool(self, off):
+        return packer.boolean.unpack_from(self.Bytes, off)[0]
+
     def GetSlot(self, slot, d, validator_flags):
         N.enforce_number(slot, N.VOffsetTFlags)
         if validator_flags is not None:
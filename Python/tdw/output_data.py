@@ -29,6 +29,7 @@ from tdw.FBOutput import EnvironmentCollision as EnvCol
 from tdw.FBOutput import Volumes as Vol
 from tdw.FBOutput import AudioSources as Audi
 from tdw.FBOutput import AvatarChildrenNames as AvCN
+from tdw.flatbuffers.pool import release
 import numpy as np
 from typing import Tuple
 
@@ -68,11 +69,14 @@ class OutputData(object):
     def _get_xyz(vector3: Vector3) -> Tuple[float, float, float]:
         """
         returns the x, y, and z values of a Vector3, given the Vector3 object.
+        If pooling is enabled (see: `tdw.flatbuffers.pool`), the Vector3 is returned to the pool afterwards.
 
         :param vector3: The Vector3 object.
         """
 
-        return vector3.X(), vector3.Y(), vector3.Z()
+        xyz = vector3.X(), vector3.Y(), vector3.Z()
+        release(vector3)
+        return xyz
 
     @staticmethod
     def _get_quaternion(constructor) -> Tuple[float, float, float, float]:
@@ -88,11 +92,14 @@ class OutputData(object):
     def _get_xyzw(quaternion: Quaternion) -> Tuple[float, float, float, float]:
         """
         returns the x, y, and z values of a Quaternion, given the Quaternion object.
+        If pooling is enabled (see: `tdw.flatbuffers.pool`), the Quaternion is returned to the pool afterwards.
 
         :param quaternion: The Quaternion object.
         """
 
-        return quaternion.X(), quaternion.Y(), quaternion.Z(), quaternion.W()
+        xyzw = quaternion.X(), quaternion.Y(), quaternion.Z(), quaternion.W()
+        release(quaternion)
+        return xyzw
 
     @staticmethod
     def _get_color(constructor) -> Tuple[float, float, float]:
@@ -2,13 +2,13 @@ import numpy as np
 import math
 import base64
 import json
-import scipy.signal as sg
 from enum import Enum
 from typing import Dict, Optional, Tuple, Union, List
 from tdw.output_data import OutputData, Rigidbodies, Collision, EnvironmentCollision
 from pathlib import Path
 from pkg_resources import resource_filename
-from csv import DictReader
+from csv import reader
+from functools import lru_cache
 import io
 
 
@@ -49,6 +49,47 @@ class ObjectInfo:
         self.bounciness = bounciness
 
 
+class ObjectInfoTable:
+    """
+    A read-only snapshot of a `Dict[str, ObjectInfo]` as one numpy array per column, for filtering or computing over many objects at once.
+    Changes to the dictionary after the table is created aren't reflected in the table.
+
+    ```python
+    from tdw.py_impact import PyImpact, ObjectInfoTable, AudioMaterial
+
+    table = ObjectInfoTable(PyImpact.get_object_info())
+    # The names of all of the metal objects.
+    print(table.names[table.material == AudioMaterial.metal.value])
+    ```
+    """
+
+    def __init__(self, object_info: Dict[str, ObjectInfo]):
+        """
+        :param object_info: The object info. Key = the name of the model. Value = object info.
+        """
+
+        infos = list(object_info.values())
+        # The model names.
+        self.names: np.array = np.array([o.name for o in infos], dtype=object)
+        # The sound amplitudes.
+        self.amp: np.array = np.array([o.amp for o in infos], dtype=np.float64)
+        # The object masses.
+        self.mass: np.array = np.array([o.mass for o in infos], dtype=np.float64)
+        # The audio materials as AudioMaterial values.
+        self.material: np.array = np.array([o.material.value for o in infos], dtype=np.int8)
+        # The paths to the model libraries.
+        self.library: np.array = np.array([o.library for o in infos], dtype=object)
+        # The bounciness values.
+        self.bounciness: np.array = np.array([o.bounciness for o in infos], dtype=np.float64)
+        for column in [self.names, self.amp, self.mass, self.material, self.library, self.bounciness]:
+            column.flags.writeable = False
+        # Key = the model name. Value = the row index.
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 # Density per audio material.
 DENSITIES: Dict[AudioMaterial, float] = {AudioMaterial.ceramic: 2180,
                                          AudioMaterial.glass: 2500,
@@ -68,12 +109,43 @@ class Base64Sound:
         :param snd: The sound byte array.
         """
 
-        tst1 = np.array(snd * 32767, dtype='int16')
-        tst2 = bytes(tst1)
-        tst3 = base64.b64encode(tst2).decode('utf-8')
+        # Convert to 16-bit samples directly into the int16 buffer. Clip first to prevent integer wraparound.
+        tst1 = np.empty(np.shape(snd), dtype=np.int16)
+        np.multiply(np.clip(snd, -1, 1), 32767, out=tst1, casting='unsafe')
+        self._encode(tst1)
+
+    @classmethod
+    def from_float_scaled(cls, snd: np.array, amp: float):
+        """
+        Normalize a sound, scale it by an amplitude, and encode it.
+        This is the same as `Base64Sound(amp * snd / np.max(np.abs(snd)))` but converts the sound to 16-bit samples in one pass.
+
+        :param snd: The sound byte array. This doesn't need to be normalized.
+        :param amp: The amplitude of the sound.
+
+        :return: A Base64Sound.
+        """
 
-        self.wav_str = tst3
-        self.length = len(tst2)
+        scale = amp * 32767 / np.max(np.abs(snd))
+        tst1 = np.empty(np.shape(snd), dtype=np.int16)
+        if abs(amp) <= 1:
+            # Every sample is already in the int16 range.
+            np.multiply(snd, scale, out=tst1, casting='unsafe')
+        else:
+            np.clip(snd * scale, -32767, 32767, out=tst1, casting='unsafe')
+        sound = cls.__new__(cls)
+        sound._encode(tst1)
+        return sound
+
+    def _encode(self, tst1: np.array) -> None:
+        """
+        Encode 16-bit samples. The buffer is encoded without copying it to a bytes object.
+
+        :param tst1: The sound as an int16 array.
+        """
+
+        self.wav_str = base64.b64encode(memoryview(tst1)).decode('ascii')
+        self.length = tst1.nbytes
 
 
 class Modes:
@@ -98,27 +170,35 @@ class Modes:
         :return A synthesized sound.
         """
 
-        # Scroll through modes
-        for i in range(len(self.frequencies)):
-            H_dB = 80 + self.powers[i]
-            L_ms = self.decay_times[i] * H_dB / 60
-            mLen = math.ceil(L_ms / 1e3 * fs)
-            # if mode length is greater than the current time-series we have had make our time series longer
-            max_len = mLen
-            if mLen > max_len:
-                max_len = mLen
-            tt = np.arange(0, max_len) / fs
-            # synthesize a sinusoid
-            mode = np.cos(2 * math.pi * self.frequencies[i] * tt)
-            mode = mode * (10 ** (self.powers[i] / 20))
-            dcy = tt * (60 / (self.decay_times[i] / 1e3))
-            env = 10 ** (-dcy / 20)
-            mode = mode * env
-            if i == 0:
-                synth_sound = mode
-            else:
-                synth_sound = Modes.mode_add(synth_sound, mode)
-        return synth_sound
+        frequencies = np.asarray(self.frequencies, dtype=np.float64)
+        powers = np.asarray(self.powers, dtype=np.float64)
+        decay_times = np.asarray(self.decay_times, dtype=np.float64)
+        # The length of each mode. The sound is as long as the longest mode.
+        H_dB = 80 + powers
+        L_ms = decay_times * H_dB / 60
+        m_lens = np.ceil(L_ms / 1e3 * fs).astype(np.int64)
+        np.maximum(m_lens, 0, out=m_lens)
+        # Lay out every mode back to back in one array so that all of them are synthesized at once.
+        # `n` is the index of each sample within its own mode.
+        n = np.arange(m_lens.sum())
+        n -= np.repeat(np.cumsum(m_lens) - m_lens, m_lens)
+        # The samples are synthesized as float32, which is ~3x faster than float64.
+        # The error is below the precision of the 16-bit audio that is sent to the build.
+        tt = n.astype(np.float32)
+        tt /= fs
+        # Synthesize the sinusoids.
+        synth_sound = np.repeat((2 * math.pi * frequencies).astype(np.float32), m_lens)
+        synth_sound *= tt
+        np.cos(synth_sound, out=synth_sound)
+        # 10^(power / 20) * 10^(-dcy / 20) as a single exp().
+        env = np.repeat((60 / (decay_times / 1e3)).astype(np.float32), m_lens)
+        env *= tt
+        np.subtract(np.repeat(powers.astype(np.float32), m_lens), env, out=env)
+        env *= np.float32(math.log(10) / 20)
+        np.exp(env, out=env)
+        synth_sound *= env
+        # Sum the modes sample by sample.
+        return np.bincount(n, weights=synth_sound, minlength=int(m_lens.max(initial=0)))
 
     @staticmethod
     def mode_add(a: np.array, b: np.array) -> np.array:
@@ -193,6 +273,11 @@ class PyImpact:
     ```
     """
 
+    # Half-sine force pulses. Key = the number of points. There are at most 89 of these (see `synth_impact_modes()`).
+    _FRC_CACHE: Dict[int, np.array] = {}
+    # The parsed material data. Key = the material name. Value = the material data.
+    _MATERIAL_DATA: Dict[str, dict] = {}
+
     def __init__(self, initial_amp: float = 0.5, prevent_distortion: bool = True):
         """
         :param initial_amp: The initial amplitude, i.e. the "master volume". Must be > 0 and < 1.
@@ -204,16 +289,40 @@ class PyImpact:
         self.initial_amp = initial_amp
         self.prevent_distortion = prevent_distortion
 
-        # The collision info per set of objects.
-        self.object_modes: Dict[int, Dict[int, CollisionInfo]] = {}
-
+        # The collision info per set of objects. Key = (id2, id1) as passed to `get_sound()`.
+        self.object_modes: Dict[Tuple[int, int], CollisionInfo] = {}
+
+        # The most recent Rigidbodies output data and its object indices. Key = object ID. Value = index.
+        self._rigidbodies: Optional[Rigidbodies] = None
+        self._rigidbody_indices: Dict[int, int] = {}
+
+        # Parse the material data only once, the first time a PyImpact object is created.
+        if len(PyImpact._MATERIAL_DATA) == 0:
+            for mat, path in zip(["ceramic", "hardwood", "metal", "glass", "wood", "cardboard"],
+                                 ["Ceramic_mm", "Poplar_mm", "MetalStrip_mm", "Mirror_mm", "BalsaWood_mm", "Cardboard_mm"]):
+                # Load the JSON data.
+                data = json.loads(Path(resource_filename(__name__, f"py_impact/material_data/{path}.json")).read_text())
+                # Convert the mode properties to numpy arrays once instead of per object.
+                for key in ["cf", "op", "rt"]:
+                    data[key] = np.array(data[key])
+                PyImpact._MATERIAL_DATA[mat] = data
         # Cache the material data. This is use to reset the material modes.
-        self.material_data: Dict[str, dict] = {}
-        for mat, path in zip(["ceramic", "hardwood", "metal", "glass", "wood", "cardboard"],
-                             ["Ceramic_mm", "Poplar_mm", "MetalStrip_mm", "Mirror_mm", "BalsaWood_mm", "Cardboard_mm"]):
-            # Load the JSON data.
-            data = json.loads(Path(resource_filename(__name__, f"py_impact/material_data/{path}.json")).read_text())
-            self.material_data.update({mat: data})
+        # Copy the data so that changes to it don't affect other PyImpact objects.
+        self.material_data: Dict[str, dict] = {k: {key: value.copy() if isinstance(value, np.ndarray) else value
+                                                   for key, value in v.items()}
+                                               for k, v in PyImpact._MATERIAL_DATA.items()}
+
+    def _get_rigidbody_indices(self, rigidbodies: Rigidbodies) -> Dict[int, int]:
+        """
+        :param rigidbodies: TDW `Rigidbodies` output data.
+
+        :return: The index of each object in `rigidbodies`. Key = object ID. Value = index. This is cached until `rigidbodies` changes.
+        """
+
+        if rigidbodies is not self._rigidbodies:
+            self._rigidbodies = rigidbodies
+            self._rigidbody_indices = {rigidbodies.get_id(i): i for i in range(rigidbodies.get_num())}
+        return self._rigidbody_indices
 
     def _get_object_modes(self, material: Union[str, AudioMaterial]) -> Modes:
         """
@@ -223,26 +332,23 @@ class PyImpact:
         """
 
         data = self.material_data[material] if isinstance(material, str) else self.material_data[material.name]
-        # Load the mode properties.
-        f = -1
-        p = -1
-        t = -1
-        for jm in range(0, 10):
-            jf = 0
-            while jf < 20:
-                jf = data["cf"][jm] + np.random.normal(0, data["cf"][jm] / 10)
-            jp = data["op"][jm] + np.random.normal(0, 10)
-            jt = 0
-            while jt < 0.001:
-                jt = data["rt"][jm] + np.random.normal(0, data["rt"][jm] / 10)
-            if jm == 0:
-                f = jf
-                p = jp
-                t = jt * 1e3
-            else:
-                f = np.append(f, jf)
-                p = np.append(p, jp)
-                t = np.append(t, jt * 1e3)
+        # Load the mode properties. User-supplied material data might be lists (as parsed from JSON).
+        cf = np.asarray(data["cf"][:10], dtype=np.float64)
+        op = np.asarray(data["op"][:10], dtype=np.float64)
+        rt = np.asarray(data["rt"][:10], dtype=np.float64)
+        # Sample all of the modes at once. Resample only the modes whose values are out of range.
+        f = cf + np.random.normal(0, cf / 10)
+        resample = f < 20
+        while np.any(resample):
+            f[resample] = cf[resample] + np.random.normal(0, cf[resample] / 10)
+            resample = f < 20
+        p = op + np.random.normal(0, 10, size=op.shape)
+        t = rt + np.random.normal(0, rt / 10)
+        resample = t < 0.001
+        while np.any(resample):
+            t[resample] = rt[resample] + np.random.normal(0, rt[resample] / 10)
+            resample = t < 0.001
+        t *= 1e3
         return Modes(f, p, t)
 
     def get_sound(self, collision: Union[Collision, EnvironmentCollision], rigidbodies: Rigidbodies, id1: int, mat1: str, id2: int, mat2: str, amp2re1: float) -> Optional[Base64Sound]:
@@ -261,48 +367,38 @@ class PyImpact:
         """
 
         # Set the object modes.
-        if id2 not in self.object_modes:
-            self.object_modes.update({id2: {}})
-        if id1 not in self.object_modes[id2]:
-            self.object_modes[id2].update({id1: CollisionInfo(self._get_object_modes(mat2),
-                                                              self._get_object_modes(mat1),
-                                                              amp=self.initial_amp)})
+        key = (id2, id1)
+        ci = self.object_modes.get(key)
+        if ci is None:
+            ci = CollisionInfo(self._get_object_modes(mat2), self._get_object_modes(mat1), amp=self.initial_amp)
+            self.object_modes[key] = ci
 
         obj_col = isinstance(collision, Collision)
 
         # Unpack useful parameters.
         # Compute normal velocity at impact.
-        vel = 0
+        rigidbody_indices = self._get_rigidbody_indices(rigidbodies)
+        # Get indices of objects in collisions
+        id1_index = rigidbody_indices.get(id1)
+        id2_index = rigidbody_indices.get(id2)
+        vel = (0, 0, 0)
         if obj_col:
             vel = collision.get_relative_velocity()
-        else:
-            for i in range(rigidbodies.get_num()):
-                if rigidbodies.get_id(i) == id2:
-                    vel = rigidbodies.get_velocity(i)
-                    break
-        vel = np.asarray(vel)
-        speed = np.square(vel)
-        speed = np.sum(speed)
-        speed = math.sqrt(speed)
-        nvel = vel / np.linalg.norm(vel)
+        elif id2_index is not None:
+            vel = rigidbodies.get_velocity(id2_index)
+        # The velocity is only 3 floats, so this is faster as scalar math than as numpy.
+        vx, vy, vz = vel
+        speed = math.sqrt(vx * vx + vy * vy + vz * vz)
+        nvel = np.array((vx / speed, vy / speed, vz / speed) if speed > 0 else (0, 0, 0), dtype=np.float64)
         num_contacts = collision.get_num_contacts()
-        nspd = []
-        for jc in range(0, num_contacts):
-            tmp = np.asarray(collision.get_contact_normal(jc))
-            tmp = tmp / np.linalg.norm(tmp)
-            tmp = np.arccos(np.clip(np.dot(tmp, nvel), -1.0, 1.0))
-            # Scale the speed by the angle (i.e. we want speed Normal to the surface).
-            tmp = speed * np.cos(tmp)
-            nspd.append(tmp)
+        # A (num_contacts, 3) array of unit contact normals.
+        normals = np.array([collision.get_contact_normal(jc) for jc in range(0, num_contacts)],
+                           dtype=np.float64).reshape(num_contacts, 3)
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        # Scale the speed by the cosine of the angle (i.e. we want speed Normal to the surface).
+        # The dot product of two unit vectors already is the cosine, so this doesn't need arccos() and cos().
+        nspd = speed * np.clip(normals @ nvel, -1.0, 1.0)
         normal_speed = np.mean(nspd)
-        # Get indices of objects in collisions
-        id1_index = None
-        id2_index = None
-        for i in range(rigidbodies.get_num()):
-            if rigidbodies.get_id(i) == id1:
-                id1_index = i
-            if rigidbodies.get_id(i) == id2:
-                id2_index = i
 
         # Make sure both IDs were found. If they aren't, don't return a sound.
         if obj_col and (id1_index is None or id2_index is None):
@@ -310,41 +406,42 @@ class PyImpact:
 
         m1 = rigidbodies.get_mass(id1_index) if obj_col else 1000
         m2 = rigidbodies.get_mass(id2_index)
-        mass = np.min([m1, m2])
+        mass = min(m1, m2)
 
         # Re-scale the amplitude.
-        if self.object_modes[id2][id1].count == 0:
+        if ci.count == 0:
             # Sample the modes.
             sound, modes_1, modes_2 = self.make_impact_audio(amp2re1, mass, mat1=mat1, mat2=mat2, id1=id1, id2=id2)
             # Save collision info - we will need for later collisions.
-            amp = self.object_modes[id2][id1].amp
-            self.object_modes[id2][id1].init_speed = normal_speed
-            self.object_modes[id2][id1].obj1_modes = modes_1
-            self.object_modes[id2][id1].obj2_modes = modes_2
+            amp = ci.amp
+            ci.init_speed = normal_speed
+            ci.obj1_modes = modes_1
+            ci.obj2_modes = modes_2
         else:
-            amp = self.object_modes[id2][id1].amp * normal_speed / self.object_modes[id2][id1].init_speed
+            amp = ci.amp * normal_speed / ci.init_speed
             # Adjust modes here so that two successive impacts are not identical.
-            modes_1 = self.object_modes[id2][id1].obj1_modes
-            modes_2 = self.object_modes[id2][id1].obj2_modes
-            modes_1.powers = modes_1.powers + np.random.normal(0, 2, len(modes_1.powers))
-            modes_2.power = modes_2.powers + np.random.normal(0, 2, len(modes_1.powers))
+            modes_1 = ci.obj1_modes
+            modes_2 = ci.obj2_modes
+            # Draw the noise for both objects at once.
+            noise = np.random.normal(0, 2, len(modes_1.powers) + len(modes_2.powers))
+            modes_1.powers = modes_1.powers + noise[:len(modes_1.powers)]
+            modes_2.powers = modes_2.powers + noise[len(modes_1.powers):]
             sound = PyImpact.synth_impact_modes(modes_1, modes_2, mass)
-            self.object_modes[id2][id1].obj1_modes = modes_1
-            self.object_modes[id2][id1].obj2_modes = modes_2
+            ci.obj1_modes = modes_1
+            ci.obj2_modes = modes_2
 
         # On rare occasions, it is possible for PyImpact to fail to generate a sound.
         if sound is None:
             return None
 
         # Count the collisions.
-        self.object_modes[id2][id1].count_collisions()
+        ci.count_collisions()
 
         # Prevent distortion by clamping the amp.
         if self.prevent_distortion and amp > 0.99:
             amp = 0.99
 
-        sound = amp * sound / np.max(np.abs(sound))
-        return Base64Sound(sound)
+        return Base64Sound.from_float_scaled(sound, amp)
 
     def get_impact_sound_command(self, collision: Union[Collision, EnvironmentCollision], rigidbodies: Rigidbodies, target_id: int, target_mat: str, target_amp: float, other_id: int, other_mat: str, other_amp: float, play_audio_data: bool = True) -> dict:
         """
@@ -395,16 +492,14 @@ class PyImpact:
         """
 
         # Unpack material names.
-        for jmat in range(0, len(AudioMaterial)):
-            if mat1 == AudioMaterial(jmat):
-                tmp1 = AudioMaterial(jmat)
-                mat1 = tmp1.name
-            if mat2 == AudioMaterial(jmat):
-                tmp2 = AudioMaterial(jmat)
-                mat2 = tmp2.name
+        if isinstance(mat1, AudioMaterial):
+            mat1 = mat1.name
+        if isinstance(mat2, AudioMaterial):
+            mat2 = mat2.name
         # Sample modes of object1.
-        modes_1 = self.object_modes[id2][id1].obj1_modes
-        modes_2 = self.object_modes[id2][id1].obj2_modes
+        ci = self.object_modes[(id2, id1)]
+        modes_1 = ci.obj1_modes
+        modes_2 = ci.obj2_modes
         # Scale the two sounds as specified.
         modes_2.decay_times = modes_2.decay_times + 20 * np.log10(amp2re1)
         snth = PyImpact.synth_impact_modes(modes_1, modes_2, mass)
@@ -422,19 +517,24 @@ class PyImpact:
         :return The impact sound.
         """
 
-        h1 = modes1.sum_modes()
-        h2 = modes2.sum_modes()
-        h = Modes.mode_add(h1, h2)
+        # Synthesize the modes of both objects as one set of modes.
+        # This is the same as summing each object's modes and then adding them with `Modes.mode_add()`.
+        h = Modes(np.concatenate((modes1.frequencies, modes2.frequencies)),
+                  np.concatenate((modes1.powers, modes2.powers)),
+                  np.concatenate((modes1.decay_times, modes2.decay_times))).sum_modes()
         if len(h) == 0:
             return None
         # Convolve with force, with contact time scaled by the object mass.
-        max_t = 0.001 * mass
         # A contact time over 2ms is unphysically long.
-        max_t = np.min([max_t, 2e-3])
-        n_pts = int(np.ceil(max_t * 44100))
-        tt = np.linspace(0, np.pi, n_pts)
-        frc = np.sin(tt)
-        x = sg.fftconvolve(h, frc)
+        max_t = min(0.001 * mass, 2e-3)
+        n_pts = int(math.ceil(max_t * 44100))
+        frc = PyImpact._FRC_CACHE.get(n_pts)
+        if frc is None:
+            tt = np.linspace(0, np.pi, n_pts)
+            frc = np.sin(tt)
+            PyImpact._FRC_CACHE[n_pts] = frc
+        # The force pulse is at most 89 samples long, so direct convolution is faster than FFT convolution.
+        x = np.convolve(h, frc)
         x = x / abs(np.max(x))
         return x
 
@@ -443,13 +543,14 @@ class PyImpact:
         """
         Returns ObjectInfo values.
         As of right now, only a few objects in the TDW model libraries are included. More will be added in time.
+        The .csv file is parsed only the first time it is loaded (or after it changes); each call returns a new copy of the data.
+        To get the values as numpy arrays, see `ObjectInfoTable`.
 
         :param csv_file: The path to the .csv file containing the object info. By default, it will load `tdw/py_impact/objects.csv`. If you want to make your own spreadsheet, use this file as a reference.
 
         :return: A list of default ObjectInfo. Key = the name of the model. Value = object info.
         """
 
-        objects: Dict[str, ObjectInfo] = {}
         # Load the objects.csv metadata file.
         if isinstance(csv_file, str):
             # Load the default file.
@@ -459,16 +560,38 @@ class PyImpact:
                 csv_file = str(Path(csv_file).resolve())
         else:
             csv_file = str(csv_file.resolve())
+        # The parsed file is cached until it is modified. Return copies so that the cached data can't be changed.
+        return {name: ObjectInfo(name=o.name, amp=o.amp, mass=o.mass, material=o.material, library=o.library,
+                                 bounciness=o.bounciness)
+                for name, o in PyImpact._load_object_info(csv_file, Path(csv_file).stat().st_mtime_ns).items()}
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_object_info(csv_file: str, mtime: int) -> Dict[str, ObjectInfo]:
+        """
+        :param csv_file: The resolved path to the .csv file.
+        :param mtime: The time that the file was last modified. This is only used as part of the cache key.
+
+        :return: The parsed .csv file.
+        """
+
+        objects: Dict[str, ObjectInfo] = {}
         # Parse the .csv file.
         with io.open(csv_file, newline='', encoding='utf-8-sig') as f:
-            reader = DictReader(f)
-            for row in reader:
-                o = ObjectInfo(name=row["name"], amp=float(row["amp"]), mass=float(row["mass"]),
-                               material=AudioMaterial[row["material"]], library=row["library"],
-                               bounciness=float(row["bounciness"]))
-                objects.update({o.name: o})
-
+            rows = reader(f)
+            header = next(rows)
+            columns = {key: i for i, key in enumerate(header)}
+            for row in rows:
+                # Skip blank lines.
+                if not row:
+                    continue
+                if len(row) != len(header):
+                    raise ValueError(f"{csv_file} line {rows.line_num}: Expected {len(header)} values but got "
+                                     f"{len(row)}: {row}")
+                o = ObjectInfo(name=row[columns["name"]], amp=float(row[columns["amp"]]),
+                               mass=float(row[columns["mass"]]), material=AudioMaterial[row[columns["material"]]],
+                               library=row[columns["library"]], bounciness=float(row[columns["bounciness"]]))
+                objects[o.name] = o
         return objects
 
     @staticmethod
@@ -505,9 +628,13 @@ class PyImpact:
         :return: True if this collision can be used to generate an impact sound.
         """
 
-        return collision is not None and ((isinstance(collision, Collision) and
-                                           np.linalg.norm(collision.get_relative_velocity()) > 0) or
-                                          isinstance(collision, EnvironmentCollision))
+        if collision is None:
+            return False
+        if isinstance(collision, Collision):
+            # The speed is > 0 if and only if the squared speed is > 0, so this doesn't need a sqrt().
+            vx, vy, vz = collision.get_relative_velocity()
+            return vx * vx + vy * vy + vz * vz > 0
+        return isinstance(collision, EnvironmentCollision)
 
     def reset(self, initial_amp: float = 0.5) -> None:
         """
@@ -520,3 +647,5 @@ class PyImpact:
 
         # Clear the object data.
         self.object_modes.clear()
+        self._rigidbodies = None
+        self._rigidbody_indices = {}